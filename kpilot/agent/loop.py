@@ -1,24 +1,55 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from dataclasses import dataclass
-from typing import Callable
-
-from claude_code_sdk import (
-    query,
-    ClaudeCodeOptions,
-    AssistantMessage,
-    UserMessage,
-    SystemMessage,
-    ResultMessage,
-    TextBlock,
-    ThinkingBlock,
-    ToolUseBlock,
-    ToolResultBlock,
-)
-
-
-@dataclass
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+if TYPE_CHECKING:
+    # Annotation-only imports; the runtime import stays deferred in
+    # _sdk_module() so TUI startup doesn't pay for it.
+    from claude_code_sdk import (
+        AssistantMessage,
+        ResultMessage,
+        SystemMessage,
+        TextBlock,
+        ThinkingBlock,
+        ToolResultBlock,
+        ToolUseBlock,
+        UserMessage,
+    )
+
+
+def _dumps_indented(obj: object) -> str:
+    """Serialize a tool input dict with 2-space indentation."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+_sdk = None
+
+
+def _sdk_module():
+    """Import claude_code_sdk on first use.
+
+    Deferred so TUI startup doesn't pay the SDK import cost before the
+    first copilot prompt.
+    """
+    global _sdk
+    if _sdk is None:
+        import claude_code_sdk
+
+        _sdk = claude_code_sdk
+    return _sdk
+
+
+@dataclass(slots=True)
 class AgentEvent:
     """A single event emitted by the agent loop."""
 
@@ -40,13 +71,75 @@ class AgentLoop:
         namespace: str = "default",
         model: str | None = None,
     ) -> None:
-        self.cluster_name = cluster_name
-        self.context_name = context_name
-        self.namespace = namespace
+        self._cluster_name = cluster_name
+        self._context_name = context_name
+        self._namespace = namespace
         self.model = model
-        self._cancelled = False
+        self._cached_prompt: str | None = None
+        self._task: asyncio.Task | None = None
+        # Persistent SDK client reused across turns; (prompt, model) it was
+        # connected with, so context/namespace switches trigger a reconnect.
+        self._client: Any | None = None
+        self._client_key: tuple[str, str | None] | None = None
+        # Type-keyed dispatch tables: one hash lookup per SDK message/block
+        # instead of an isinstance cascade on the streaming hot path. Built
+        # lazily since the SDK types are imported on first use.
+        self._msg_handlers: dict[type, Callable] | None = None
+        self._block_handlers: dict[type, Callable] | None = None
+
+    def _ensure_handlers(self) -> None:
+        if self._msg_handlers is not None:
+            return
+        sdk = _sdk_module()
+        self._msg_handlers = {
+            sdk.AssistantMessage: self._handle_assistant,
+            sdk.UserMessage: self._handle_user,
+            sdk.ResultMessage: self._handle_result,
+            sdk.SystemMessage: self._handle_system,
+        }
+        self._block_handlers = {
+            sdk.TextBlock: self._handle_text_block,
+            sdk.ThinkingBlock: self._handle_thinking_block,
+            sdk.ToolUseBlock: self._handle_tool_use_block,
+            sdk.ToolResultBlock: self._handle_tool_result_block,
+        }
+
+    # The system prompt only changes when the cluster context does, so it is
+    # memoized and invalidated by the property setters below.
+
+    @property
+    def cluster_name(self) -> str:
+        return self._cluster_name
+
+    @cluster_name.setter
+    def cluster_name(self, value: str) -> None:
+        self._cluster_name = value
+        self._cached_prompt = None
+
+    @property
+    def context_name(self) -> str:
+        return self._context_name
+
+    @context_name.setter
+    def context_name(self, value: str) -> None:
+        self._context_name = value
+        self._cached_prompt = None
+
+    @property
+    def namespace(self) -> str:
+        return self._namespace
+
+    @namespace.setter
+    def namespace(self, value: str) -> None:
+        self._namespace = value
+        self._cached_prompt = None
 
     def _system_prompt(self) -> str:
+        if self._cached_prompt is None:
+            self._cached_prompt = self._build_prompt()
+        return self._cached_prompt
+
+    def _build_prompt(self) -> str:
         return f"""You are a Kubernetes cluster assistant embedded in a terminal UI (similar to k9s).
 You have access to bash to run kubectl commands against the cluster.
 
@@ -63,91 +156,209 @@ Guidelines:
 - If a command fails, explain the error clearly.
 - You can chain multiple kubectl calls to gather information before answering."""
 
+    async def stream(self, prompt: str) -> AsyncIterator[AgentEvent]:
+        """Run the agentic loop for a single user prompt, yielding events.
+
+        Events are batched per SDK message through an asyncio.Queue so the
+        producer (SDK iteration) and consumer (UI) overlap instead of
+        alternating on every block. The final event is always kind="done".
+        """
+        # Client setup (SDK import, CLI spawn, handshake) can fail; that
+        # must surface as an error event like any mid-stream failure,
+        # not escape the generator and take the worker down.
+        try:
+            sdk = _sdk_module()
+            self._ensure_handlers()
+            client = await self._ensure_client(sdk)
+        except Exception as e:
+            yield AgentEvent(kind="error", text=str(e), is_error=True)
+            yield AgentEvent(kind="done")
+            return
+
+        # None is the end-of-stream sentinel.
+        queue: asyncio.Queue[list[AgentEvent] | None] = asyncio.Queue()
+
+        async def _produce() -> None:
+            try:
+                await client.query(prompt)
+                async for msg in client.receive_response():
+                    batch = self._process_message(msg)
+                    if batch:
+                        queue.put_nowait(batch)
+            except Exception as e:
+                # Drop the session; a fresh client reconnects next turn.
+                await self.close()
+                queue.put_nowait(
+                    [AgentEvent(kind="error", text=str(e), is_error=True)]
+                )
+            finally:
+                queue.put_nowait(None)
+
+        producer = asyncio.ensure_future(_produce())
+        self._task = asyncio.current_task()
+        try:
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    break
+                for event in batch:
+                    yield event
+        finally:
+            # Runs both on normal completion and when cancel() cancels the
+            # consuming task (which closes this generator).
+            self._task = None
+            cancelled = not producer.done()
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+            if cancelled:
+                # The session was interrupted mid-response; don't reuse it.
+                await self.close()
+
+        yield AgentEvent(kind="done")
+
     async def run(
         self,
         prompt: str,
         on_event: Callable[[AgentEvent], None] | None = None,
     ) -> None:
-        """Run the agentic loop for a single user prompt."""
-        self._cancelled = False
+        """Callback-style adapter over stream()."""
+        async for event in self.stream(prompt):
+            if on_event:
+                on_event(event)
+
+    async def _ensure_client(self, sdk) -> Any:
+        """Return a connected SDK client, reusing it across turns.
 
-        options = ClaudeCodeOptions(
-            system_prompt=self._system_prompt(),
+        A fresh query() call spawns a new CLI subprocess per turn; keeping
+        one ClaudeSDKClient connected amortizes that setup. The client is
+        rebuilt when the system prompt or model changes.
+        """
+        key = (self._system_prompt(), self.model)
+        if self._client is not None and self._client_key == key:
+            return self._client
+        await self.close()
+        options = sdk.ClaudeCodeOptions(
+            system_prompt=key[0],
             allowed_tools=["Bash"],
             permission_mode="bypassPermissions",
             max_turns=30,
         )
         if self.model:
             options.model = self.model
+        client = sdk.ClaudeSDKClient(options)
+        await client.connect()
+        self._client = client
+        self._client_key = key
+        return client
 
-        try:
-            async for msg in query(prompt=prompt, options=options):
-                if self._cancelled:
-                    break
-                self._process_message(msg, on_event)
-        except Exception as e:
-            if on_event:
-                on_event(AgentEvent(kind="error", text=str(e), is_error=True))
-
-        if on_event:
-            on_event(AgentEvent(kind="done"))
+    async def close(self) -> None:
+        """Disconnect the persistent SDK client, if any."""
+        client, self._client = self._client, None
+        self._client_key = None
+        if client is not None:
+            try:
+                await client.disconnect()
+            except Exception:
+                pass
 
     def cancel(self) -> None:
-        self._cancelled = True
+        """Cancel the in-flight turn, if any.
+
+        Cancelling the consuming task propagates immediately into the
+        SDK's awaited I/O instead of waiting for the next message to poll
+        a flag.
+        """
+        if self._task is not None:
+            self._task.cancel()
+
+    def _process_message(self, msg: object) -> list[AgentEvent]:
+        if self._msg_handlers is None:
+            self._ensure_handlers()
+        batch: list[AgentEvent] = []
+        handler = self._msg_handlers.get(type(msg))
+        if handler:
+            handler(msg, batch)
+        return batch
+
+    def _process_block(self, block: object, batch: list[AgentEvent]) -> None:
+        handler = self._block_handlers.get(type(block))
+        if handler:
+            handler(block, batch)
+
+    # ── Message handlers ──────────────────────────────────────────
 
-    def _process_message(
-        self, msg: object, on_event: Callable[[AgentEvent], None] | None
+    def _handle_assistant(
+        self, msg: AssistantMessage, batch: list[AgentEvent]
     ) -> None:
-        if on_event is None:
-            return
+        for block in msg.content:
+            self._process_block(block, batch)
+
+    def _handle_user(self, msg: UserMessage, batch: list[AgentEvent]) -> None:
+        # User messages from the SDK contain tool results
+        content = msg.content
+        if isinstance(content, list):
+            for block in content:
+                self._process_block(block, batch)
 
-        if isinstance(msg, AssistantMessage):
-            for block in msg.content:
-                self._process_block(block, on_event)
-        elif isinstance(msg, UserMessage):
-            # User messages from the SDK contain tool results
-            content = msg.content
-            if isinstance(content, list):
-                for block in content:
-                    self._process_block(block, on_event)
-        elif isinstance(msg, ResultMessage):
-            if msg.is_error:
-                on_event(AgentEvent(
-                    kind="error",
-                    text=msg.result or "Unknown error",
-                    is_error=True,
-                ))
-        elif isinstance(msg, SystemMessage):
-            pass  # Internal system messages, ignore
-
-    def _process_block(
-        self, block: object, on_event: Callable[[AgentEvent], None]
+    def _handle_result(
+        self, msg: ResultMessage, batch: list[AgentEvent]
     ) -> None:
-        if isinstance(block, TextBlock):
-            on_event(AgentEvent(kind="text", text=block.text))
-        elif isinstance(block, ThinkingBlock):
-            on_event(AgentEvent(kind="thinking", text=block.thinking))
-        elif isinstance(block, ToolUseBlock):
-            input_str = json.dumps(block.input, indent=2) if block.input else ""
-            on_event(AgentEvent(
-                kind="tool_use",
-                tool_name=block.name,
-                tool_input=input_str,
-                tool_id=block.id,
-            ))
-        elif isinstance(block, ToolResultBlock):
-            content = block.content
-            if isinstance(content, list):
-                parts = []
-                for c in content:
-                    if isinstance(c, dict) and c.get("type") == "text":
-                        parts.append(c.get("text", ""))
-                    else:
-                        parts.append(str(c))
-                content = "\n".join(parts)
-            on_event(AgentEvent(
-                kind="tool_result",
-                text=str(content or ""),
-                tool_id=block.tool_use_id,
-                is_error=bool(block.is_error),
+        if msg.is_error:
+            batch.append(AgentEvent(
+                kind="error",
+                text=msg.result or "Unknown error",
+                is_error=True,
             ))
+
+    def _handle_system(
+        self, msg: SystemMessage, batch: list[AgentEvent]
+    ) -> None:
+        pass  # Internal system messages, ignore
+
+    # ── Block handlers ────────────────────────────────────────────
+
+    def _handle_text_block(
+        self, block: TextBlock, batch: list[AgentEvent]
+    ) -> None:
+        batch.append(AgentEvent(kind="text", text=block.text))
+
+    def _handle_thinking_block(
+        self, block: ThinkingBlock, batch: list[AgentEvent]
+    ) -> None:
+        batch.append(AgentEvent(kind="thinking", text=block.thinking))
+
+    def _handle_tool_use_block(
+        self, block: ToolUseBlock, batch: list[AgentEvent]
+    ) -> None:
+        input_str = _dumps_indented(block.input) if block.input else ""
+        batch.append(AgentEvent(
+            kind="tool_use",
+            tool_name=block.name,
+            tool_input=input_str,
+            tool_id=block.id,
+        ))
+
+    def _handle_tool_result_block(
+        self, block: ToolResultBlock, batch: list[AgentEvent]
+    ) -> None:
+        content = block.content
+        if isinstance(content, list):
+            text = "\n".join(
+                c.get("text", "")
+                if isinstance(c, dict) and c.get("type") == "text"
+                else str(c)
+                for c in content
+            )
+        elif isinstance(content, str):
+            text = content
+        else:
+            text = str(content) if content is not None else ""
+        batch.append(AgentEvent(
+            kind="tool_result",
+            text=text,
+            tool_id=block.tool_use_id,
+            is_error=bool(block.is_error),
+        ))
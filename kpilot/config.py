@@ -4,6 +4,10 @@ import os
 from dataclasses import dataclass
 from pathlib import Path
 
+_DEFAULT_KUBECONFIG = str(Path.home() / ".kube" / "config")
+
+_cached: Config | None = None
+
 
 @dataclass
 class Config:
@@ -14,12 +18,20 @@ class Config:
 
     @classmethod
     def load(cls) -> Config:
+        """Return the process-wide config, reading the environment once."""
+        global _cached
+        if _cached is None:
+            _cached = cls.reload()
+        return _cached
+
+    @classmethod
+    def reload(cls) -> Config:
+        """Re-read the environment, replacing the cached config."""
+        global _cached
         cfg = cls()
         cfg.anthropic_key = os.environ.get("ANTHROPIC_API_KEY", "")
         cfg.model = os.environ.get("KPILOT_MODEL", cfg.model)
         cfg.namespace = os.environ.get("KPILOT_NAMESPACE", cfg.namespace)
-        cfg.kubeconfig = os.environ.get(
-            "KUBECONFIG",
-            str(Path.home() / ".kube" / "config"),
-        )
+        cfg.kubeconfig = os.environ.get("KUBECONFIG", _DEFAULT_KUBECONFIG)
+        _cached = cfg
         return cfg
@@ -1,9 +1,83 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Any
 
-from kubernetes import client as k8s_client, config as k8s_config
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speedup
+    import json
+
+    _json_loads = json.loads
+
+def _k8s():
+    """Import the kubernetes client on first use.
+
+    The generated OpenAPI models are several MB of modules; deferring the
+    import keeps TUI startup fast when no cluster is touched yet.
+    """
+    from kubernetes import client as k8s_client, config as k8s_config
+
+    return k8s_client, k8s_config
+
+
+# Node labels carrying cluster roles, e.g. node-role.kubernetes.io/control-plane
+_ROLE_PFX = "node-role.kubernetes.io/"
+_ROLE_PLEN = len(_ROLE_PFX)
+
+# Parsed kubeconfig dicts keyed on (path, mtime) so context listings and
+# client setup share a single YAML parse per file version.
+_cfg_cache: dict[tuple[str, float], dict] = {}
+
+
+def _load_kubeconfig(path: str) -> dict:
+    """Parse a kubeconfig YAML file, cached on mtime."""
+    mtime = os.stat(path).st_mtime
+    key = (path, mtime)
+    cfg = _cfg_cache.get(key)
+    if cfg is None:
+        import yaml
+
+        with open(path) as f:
+            cfg = yaml.safe_load(f) or {}
+        _cfg_cache.clear()  # only one kubeconfig is active at a time
+        _cfg_cache[key] = cfg
+    return cfg
+
+
+def _fmt_port(p: dict) -> str:
+    return f"{p.get('port')}/{p.get('protocol')}"
+
+
+def _load_contexts(path: str) -> tuple[list, dict | None]:
+    """Return (contexts, active_context) for a kubeconfig."""
+    cfg = _load_kubeconfig(path)
+    contexts = cfg.get("contexts") or []
+    current = cfg.get("current-context") or ""
+    active = next(
+        (ctx for ctx in contexts if ctx.get("name") == current), None
+    )
+    return contexts, active
+
+
+# Resource panel index -> list method, same order as the UI's
+# RESOURCE_TYPES. Lives here so the kube layer doesn't import from the
+# UI to validate it.
+RESOURCE_FETCH = {
+    0: "list_pods",
+    1: "list_services",
+    2: "list_deployments",
+    3: "list_namespaces",
+    4: "list_nodes",
+    5: "list_configmaps",
+    6: "list_secrets",
+    7: "list_pvcs",
+    8: "list_events",
+}
 
 
 @dataclass
@@ -20,15 +94,34 @@ class KubeClient:
         self.kubeconfig = kubeconfig
         self.namespace = namespace
         self.info = KubeInfo(namespace=namespace)
-        self._core: k8s_client.CoreV1Api | None = None
-        self._apps: k8s_client.AppsV1Api | None = None
+        self._core: Any | None = None  # k8s CoreV1Api once connected
+        self._apps: Any | None = None  # k8s AppsV1Api once connected
+        # node name -> (resourceVersion, rendered roles); labels only
+        # change when the node object does.
+        self._node_roles: dict[str, tuple[str, str]] = {}
+        # Server version per context; it only changes when the cluster
+        # is upgraded, so one round-trip per context is enough.
+        self._k8s_version_cache: dict[str, str] = {}
+        # context name -> (CoreV1Api, AppsV1Api); revisiting a context
+        # reuses its ApiClient (connection pool + TLS session) instead
+        # of handshaking from scratch.
+        self._client_pool: dict[str, tuple[Any, Any]] = {}
+        # Bound list methods by resource index, resolved once here
+        # instead of a getattr walk per refresh; a typo in
+        # RESOURCE_FETCH fails loudly at construction.
+        self._fetch_methods = {
+            idx: getattr(self, name) for idx, name in RESOURCE_FETCH.items()
+        }
+
+    def fetch_method(self, index: int):
+        """Return the bound list method for a resource panel index."""
+        return self._fetch_methods.get(index)
 
     def connect(self) -> None:
         """Load kubeconfig and create API clients."""
         try:
-            contexts, active = k8s_config.list_kube_config_contexts(
-                config_file=self.kubeconfig
-            )
+            k8s_client, k8s_config = _k8s()
+            contexts, active = _load_contexts(self.kubeconfig)
             if active:
                 self.info.context_name = active.get("name", "")
                 ctx = active.get("context", {})
@@ -38,9 +131,21 @@ class KubeClient:
                     self.namespace = ns
                     self.info.namespace = ns
 
-            k8s_config.load_kube_config(config_file=self.kubeconfig)
-            self._core = k8s_client.CoreV1Api()
-            self._apps = k8s_client.AppsV1Api()
+            # Reuse the dict already parsed for context discovery instead
+            # of letting load_kube_config re-read the file.
+            k8s_config.load_kube_config_from_dict(
+                _load_kubeconfig(self.kubeconfig), persist_config=False
+            )
+            # One ApiClient for both API groups so they share a connection
+            # pool (and TLS session) instead of one pool each.
+            api = k8s_client.ApiClient()
+            self._core = k8s_client.CoreV1Api(api)
+            self._apps = k8s_client.AppsV1Api(api)
+            if self.info.context_name:
+                self._client_pool[self.info.context_name] = (
+                    self._core,
+                    self._apps,
+                )
         except Exception:
             # Allow running without a cluster (UI still works)
             self._core = None
@@ -55,205 +160,288 @@ class KubeClient:
         self.info.namespace = ns
 
     # ── Resource listing ──────────────────────────────────────────
+    #
+    # Listing bypasses the OpenAPI model layer: responses are fetched raw
+    # (_preload_content=False) and parsed with orjson, extracting only the
+    # handful of fields each table shows. This avoids instantiating V1Pod
+    # etc. model objects per item, which dominates list cost on big
+    # clusters.
+
+    def _list_raw(self, method, *args, **kwargs) -> dict:
+        resp = method(*args, _preload_content=False, **kwargs)
+        return _json_loads(resp.data)
+
+    def _iter_paged(self, method, *args, limit: int = 500, **kwargs):
+        """Iterate items across server-side pages of `limit` each.
+
+        Paging keeps any single request (and the apiserver's etcd read)
+        bounded on large clusters instead of pulling everything in one
+        response.
+        """
+        token = ""
+        while True:
+            page_kwargs = dict(kwargs, limit=limit)
+            if token:
+                page_kwargs["_continue"] = token
+            obj = self._list_raw(method, *args, **page_kwargs)
+            yield from obj["items"]
+            token = (obj.get("metadata") or {}).get("continue") or ""
+            if not token:
+                break
 
     def list_pods(
-        self, namespace: str = "", label_selector: str = ""
-    ) -> tuple[list[str], list[list[str]]]:
+        self, namespace: str = "", label_selector: str = "", limit: int = 500
+    ) -> tuple[list[str], list[tuple[str, ...]]]:
         ns = namespace or self.namespace
         if not self._core:
-            return ["ERROR"], [["Not connected to cluster"]]
+            return ["ERROR"], [("Not connected to cluster",)]
         kwargs: dict[str, Any] = {}
         if label_selector:
             kwargs["label_selector"] = label_selector
-        pods = self._core.list_namespaced_pod(ns, **kwargs)
         headers = ["NAME", "READY", "STATUS", "RESTARTS", "AGE"]
-        rows = []
-        for pod in pods.items:
-            ready = sum(
-                1
-                for cs in (pod.status.container_statuses or [])
-                if cs.ready
-            )
-            total = len(pod.spec.containers)
-            restarts = sum(
-                cs.restart_count
-                for cs in (pod.status.container_statuses or [])
-            )
-            rows.append([
-                pod.metadata.name,
+        now = datetime.now(timezone.utc)
+        rows: list[tuple[str, ...]] = []
+        for pod in self._iter_paged(
+            self._core.list_namespaced_pod, ns, limit=limit, **kwargs
+        ):
+            meta = pod["metadata"]
+            status = pod.get("status", {})
+            ready = restarts = 0
+            for cs in status.get("containerStatuses") or ():
+                if cs.get("ready"):
+                    ready += 1
+                restarts += cs.get("restartCount", 0)
+            total = len(pod.get("spec", {}).get("containers") or [])
+            rows.append((
+                meta["name"],
                 f"{ready}/{total}",
-                pod.status.phase or "Unknown",
+                status.get("phase") or "Unknown",
                 str(restarts),
-                _age(pod.metadata.creation_timestamp),
-            ])
+                _age(meta.get("creationTimestamp"), now),
+            ))
         return headers, rows
 
-    def list_services(self, namespace: str = "") -> tuple[list[str], list[list[str]]]:
+    def list_services(
+        self, namespace: str = "", limit: int = 500
+    ) -> tuple[list[str], list[tuple[str, ...]]]:
         ns = namespace or self.namespace
         if not self._core:
-            return ["ERROR"], [["Not connected to cluster"]]
-        svcs = self._core.list_namespaced_service(ns)
+            return ["ERROR"], [("Not connected to cluster",)]
         headers = ["NAME", "TYPE", "CLUSTER-IP", "PORTS", "AGE"]
-        rows = []
-        for svc in svcs.items:
-            ports = ",".join(
-                f"{p.port}/{p.protocol}" for p in (svc.spec.ports or [])
-            )
-            rows.append([
-                svc.metadata.name,
-                svc.spec.type or "",
-                svc.spec.cluster_ip or "",
+        now = datetime.now(timezone.utc)
+        rows: list[tuple[str, ...]] = []
+        for svc in self._iter_paged(
+            self._core.list_namespaced_service, ns, limit=limit
+        ):
+            meta = svc["metadata"]
+            spec = svc.get("spec", {})
+            ports = ",".join(map(_fmt_port, spec.get("ports") or ()))
+            rows.append((
+                meta["name"],
+                spec.get("type") or "",
+                spec.get("clusterIP") or "",
                 ports,
-                _age(svc.metadata.creation_timestamp),
-            ])
+                _age(meta.get("creationTimestamp"), now),
+            ))
         return headers, rows
 
     def list_deployments(
         self, namespace: str = ""
-    ) -> tuple[list[str], list[list[str]]]:
+    ) -> tuple[list[str], list[tuple[str, ...]]]:
         ns = namespace or self.namespace
         if not self._apps:
-            return ["ERROR"], [["Not connected to cluster"]]
-        deps = self._apps.list_namespaced_deployment(ns)
+            return ["ERROR"], [("Not connected to cluster",)]
+        deps = self._list_raw(self._apps.list_namespaced_deployment, ns)
         headers = ["NAME", "READY", "UP-TO-DATE", "AVAILABLE", "AGE"]
-        rows = []
-        for d in deps.items:
-            s = d.status
-            rows.append([
-                d.metadata.name,
-                f"{s.ready_replicas or 0}/{s.replicas or 0}",
-                str(s.updated_replicas or 0),
-                str(s.available_replicas or 0),
-                _age(d.metadata.creation_timestamp),
-            ])
+        now = datetime.now(timezone.utc)
+        rows: list[tuple[str, ...]] = []
+        for d in deps["items"]:
+            meta = d["metadata"]
+            s = d.get("status", {})
+            rows.append((
+                meta["name"],
+                f"{s.get('readyReplicas') or 0}/{s.get('replicas') or 0}",
+                str(s.get("updatedReplicas") or 0),
+                str(s.get("availableReplicas") or 0),
+                _age(meta.get("creationTimestamp"), now),
+            ))
         return headers, rows
 
-    def list_namespaces(self) -> tuple[list[str], list[list[str]]]:
+    def list_namespaces(self) -> tuple[list[str], list[tuple[str, ...]]]:
         if not self._core:
-            return ["ERROR"], [["Not connected to cluster"]]
-        nss = self._core.list_namespace()
+            return ["ERROR"], [("Not connected to cluster",)]
+        nss = self._list_raw(self._core.list_namespace)
         headers = ["NAME", "STATUS", "AGE"]
-        rows = []
-        for ns in nss.items:
-            rows.append([
-                ns.metadata.name,
-                ns.status.phase or "",
-                _age(ns.metadata.creation_timestamp),
-            ])
+        now = datetime.now(timezone.utc)
+        rows: list[tuple[str, ...]] = []
+        for ns in nss["items"]:
+            meta = ns["metadata"]
+            rows.append((
+                meta["name"],
+                ns.get("status", {}).get("phase") or "",
+                _age(meta.get("creationTimestamp"), now),
+            ))
         return headers, rows
 
-    def list_nodes(self) -> tuple[list[str], list[list[str]]]:
+    def list_nodes(self) -> tuple[list[str], list[tuple[str, ...]]]:
         if not self._core:
-            return ["ERROR"], [["Not connected to cluster"]]
-        nodes = self._core.list_node()
+            return ["ERROR"], [("Not connected to cluster",)]
+        nodes = self._list_raw(self._core.list_node)
         headers = ["NAME", "STATUS", "ROLES", "AGE", "VERSION"]
-        rows = []
-        for node in nodes.items:
+        now = datetime.now(timezone.utc)
+        rows: list[tuple[str, ...]] = []
+        for node in nodes["items"]:
+            meta = node["metadata"]
+            node_status = node.get("status", {})
             status = "NotReady"
-            for cond in node.status.conditions or []:
-                if cond.type == "Ready" and cond.status == "True":
+            for cond in node_status.get("conditions") or []:
+                if cond.get("type") == "Ready" and cond.get("status") == "True":
                     status = "Ready"
-            roles = [
-                lbl.removeprefix("node-role.kubernetes.io/")
-                for lbl in (node.metadata.labels or {})
-                if lbl.startswith("node-role.kubernetes.io/")
-                and lbl != "node-role.kubernetes.io/"
-            ] or ["<none>"]
-            rows.append([
-                node.metadata.name,
+            name = meta["name"]
+            rv = meta.get("resourceVersion", "")
+            cached = self._node_roles.get(name)
+            if cached is not None and cached[0] == rv:
+                roles = cached[1]
+            else:
+                roles = ",".join(
+                    [
+                        lbl[_ROLE_PLEN:]
+                        for lbl in (meta.get("labels") or ())
+                        if lbl.startswith(_ROLE_PFX) and len(lbl) > _ROLE_PLEN
+                    ]
+                    or ["<none>"]
+                )
+                self._node_roles[name] = (rv, roles)
+            rows.append((
+                name,
                 status,
-                ",".join(roles),
-                _age(node.metadata.creation_timestamp),
-                node.status.node_info.kubelet_version,
-            ])
+                roles,
+                _age(meta.get("creationTimestamp"), now),
+                node_status.get("nodeInfo", {}).get("kubeletVersion", ""),
+            ))
         return headers, rows
 
     def list_configmaps(
         self, namespace: str = ""
-    ) -> tuple[list[str], list[list[str]]]:
+    ) -> tuple[list[str], list[tuple[str, ...]]]:
         ns = namespace or self.namespace
         if not self._core:
-            return ["ERROR"], [["Not connected to cluster"]]
-        cms = self._core.list_namespaced_config_map(ns)
+            return ["ERROR"], [("Not connected to cluster",)]
+        cms = self._list_raw(self._core.list_namespaced_config_map, ns)
         headers = ["NAME", "DATA", "AGE"]
-        rows = []
-        for cm in cms.items:
-            rows.append([
-                cm.metadata.name,
-                str(len(cm.data or {})),
-                _age(cm.metadata.creation_timestamp),
-            ])
+        now = datetime.now(timezone.utc)
+        rows: list[tuple[str, ...]] = []
+        for cm in cms["items"]:
+            meta = cm["metadata"]
+            rows.append((
+                meta["name"],
+                str(len(cm.get("data") or {})),
+                _age(meta.get("creationTimestamp"), now),
+            ))
         return headers, rows
 
     def list_secrets(
         self, namespace: str = ""
-    ) -> tuple[list[str], list[list[str]]]:
+    ) -> tuple[list[str], list[tuple[str, ...]]]:
         ns = namespace or self.namespace
         if not self._core:
-            return ["ERROR"], [["Not connected to cluster"]]
-        secrets = self._core.list_namespaced_secret(ns)
+            return ["ERROR"], [("Not connected to cluster",)]
+        secrets = self._list_raw(self._core.list_namespaced_secret, ns)
         headers = ["NAME", "TYPE", "DATA", "AGE"]
-        rows = []
-        for s in secrets.items:
-            rows.append([
-                s.metadata.name,
-                s.type or "",
-                str(len(s.data or {})),
-                _age(s.metadata.creation_timestamp),
-            ])
+        now = datetime.now(timezone.utc)
+        rows: list[tuple[str, ...]] = []
+        for s in secrets["items"]:
+            meta = s["metadata"]
+            rows.append((
+                meta["name"],
+                s.get("type") or "",
+                str(len(s.get("data") or {})),
+                _age(meta.get("creationTimestamp"), now),
+            ))
         return headers, rows
 
     def list_pvcs(
         self, namespace: str = ""
-    ) -> tuple[list[str], list[list[str]]]:
+    ) -> tuple[list[str], list[tuple[str, ...]]]:
         ns = namespace or self.namespace
         if not self._core:
-            return ["ERROR"], [["Not connected to cluster"]]
-        pvcs = self._core.list_namespaced_persistent_volume_claim(ns)
+            return ["ERROR"], [("Not connected to cluster",)]
+        pvcs = self._list_raw(
+            self._core.list_namespaced_persistent_volume_claim, ns
+        )
         headers = ["NAME", "STATUS", "VOLUME", "CAPACITY", "ACCESS MODES", "AGE"]
-        rows = []
-        for pvc in pvcs.items:
-            rows.append([
-                pvc.metadata.name,
-                pvc.status.phase or "",
-                pvc.spec.volume_name or "",
-                (pvc.status.capacity or {}).get("storage", ""),
-                ",".join(pvc.spec.access_modes or []),
-                _age(pvc.metadata.creation_timestamp),
-            ])
+        now = datetime.now(timezone.utc)
+        rows: list[tuple[str, ...]] = []
+        for pvc in pvcs["items"]:
+            meta = pvc["metadata"]
+            spec = pvc.get("spec", {})
+            status = pvc.get("status", {})
+            rows.append((
+                meta["name"],
+                status.get("phase") or "",
+                spec.get("volumeName") or "",
+                (status.get("capacity") or {}).get("storage", ""),
+                ",".join(spec.get("accessModes") or []),
+                _age(meta.get("creationTimestamp"), now),
+            ))
         return headers, rows
 
     def list_events(
-        self, namespace: str = ""
-    ) -> tuple[list[str], list[list[str]]]:
+        self, namespace: str = "", limit: int = 500
+    ) -> tuple[list[str], list[tuple[str, ...]]]:
         ns = namespace or self.namespace
         if not self._core:
-            return ["ERROR"], [["Not connected to cluster"]]
-        events = self._core.list_namespaced_event(ns)
+            return ["ERROR"], [("Not connected to cluster",)]
         headers = ["TYPE", "REASON", "OBJECT", "MESSAGE", "AGE"]
-        rows = []
-        for ev in events.items:
+        now = datetime.now(timezone.utc)
+        rows: list[tuple[str, ...]] = []
+        for ev in self._iter_paged(
+            self._core.list_namespaced_event, ns, limit=limit
+        ):
             obj = ""
-            if ev.involved_object:
-                kind = ev.involved_object.kind or ""
-                name = ev.involved_object.name or ""
+            involved = ev.get("involvedObject")
+            if involved:
+                kind = involved.get("kind") or ""
+                name = involved.get("name") or ""
                 obj = f"{kind}/{name}"
-            msg = (ev.message or "")[:80]
-            rows.append([
-                ev.type or "",
-                ev.reason or "",
+            msg = (ev.get("message") or "")[:80]
+            rows.append((
+                ev.get("type") or "",
+                ev.get("reason") or "",
                 obj,
                 msg,
-                _age(ev.last_timestamp or ev.metadata.creation_timestamp),
-            ])
+                _age(
+                    ev.get("lastTimestamp")
+                    or ev["metadata"].get("creationTimestamp"),
+                    now,
+                ),
+            ))
         return headers, rows
 
+    def get_k8s_version(self) -> str:
+        """Return the apiserver gitVersion, cached per context."""
+        if not self.connected:
+            return ""
+        key = self.info.context_name
+        version = self._k8s_version_cache.get(key)
+        if version is None:
+            version = self._fetch_version()
+            self._k8s_version_cache[key] = version
+        return version
+
+    def _fetch_version(self) -> str:
+        try:
+            resp = self._core.api_client.call_api(
+                "/version", "GET", _preload_content=False
+            )
+            return _json_loads(resp[0].data).get("gitVersion", "")
+        except Exception:
+            return ""
+
     def list_contexts(self) -> list[tuple[str, bool]]:
         """Return list of (context_name, is_active) tuples."""
         try:
-            contexts, active = k8s_config.list_kube_config_contexts(
-                config_file=self.kubeconfig
-            )
+            contexts, active = _load_contexts(self.kubeconfig)
             active_name = active.get("name", "") if active else ""
             return [
                 (ctx.get("name", ""), ctx.get("name", "") == active_name)
@@ -265,13 +453,22 @@ class KubeClient:
     def switch_context(self, context_name: str) -> bool:
         """Switch to a different kubeconfig context. Returns True on success."""
         try:
-            k8s_config.load_kube_config(
-                config_file=self.kubeconfig, context=context_name
-            )
+            k8s_client, k8s_config = _k8s()
+            pooled = self._client_pool.get(context_name)
+            if pooled is None:
+                k8s_config.load_kube_config_from_dict(
+                    _load_kubeconfig(self.kubeconfig),
+                    context=context_name,
+                    persist_config=False,
+                )
+                api = k8s_client.ApiClient()
+                pooled = (
+                    k8s_client.CoreV1Api(api),
+                    k8s_client.AppsV1Api(api),
+                )
+                self._client_pool[context_name] = pooled
             # Re-read context info
-            contexts, active = k8s_config.list_kube_config_contexts(
-                config_file=self.kubeconfig
-            )
+            contexts, _active = _load_contexts(self.kubeconfig)
             for ctx in contexts:
                 if ctx.get("name") == context_name:
                     self.info.context_name = context_name
@@ -282,21 +479,22 @@ class KubeClient:
                         self.namespace = ns
                         self.info.namespace = ns
                     break
-            self._core = k8s_client.CoreV1Api()
-            self._apps = k8s_client.AppsV1Api()
+            self._core, self._apps = pooled
             return True
         except Exception:
             return False
 
 
-def _age(ts) -> str:
-    if ts is None:
+def _age(ts, now: datetime | None = None) -> str:
+    if not ts:
         return "<unknown>"
-    from datetime import datetime, timezone
-
-    now = datetime.now(timezone.utc)
-    delta = now - ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else now - ts
-    secs = int(delta.total_seconds())
+    if isinstance(ts, str):
+        # Raw API timestamps are RFC3339 strings, e.g. 2024-01-01T00:00:00Z
+        ts = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    if now is None:
+        now = datetime.now(timezone.utc)
+    # k8s API timestamps are always tz-aware, so no naive-datetime branch.
+    secs = int((now - ts).total_seconds())
     if secs < 60:
         return f"{secs}s"
     if secs < 3600:
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+from kpilot.kube.client import KubeClient
+
+# resource index -> (api attribute on KubeClient, list method, namespaced)
+_WATCH_SOURCES: dict[int, tuple[str, str, bool]] = {
+    0: ("_core", "list_namespaced_pod", True),
+    1: ("_core", "list_namespaced_service", True),
+    2: ("_apps", "list_namespaced_deployment", True),
+    3: ("_core", "list_namespace", False),
+    4: ("_core", "list_node", False),
+    5: ("_core", "list_namespaced_config_map", True),
+    6: ("_core", "list_namespaced_secret", True),
+    7: ("_core", "list_namespaced_persistent_volume_claim", True),
+    8: ("_core", "list_namespaced_event", True),
+}
+
+
+def watch_changes(
+    kube: KubeClient,
+    resource_index: int,
+    on_change: Callable[[], None],
+    should_stop: Callable[[], bool],
+) -> None:
+    """Blocking watch loop: call on_change() when the watched kind changes.
+
+    Instead of re-listing on a timer, this holds a watch stream against
+    the apiserver and uses events purely as an invalidation signal — the
+    table itself is still populated through the existing list path, so
+    there is exactly one row-building code path. A cheap limit=1 LIST
+    seeds the resourceVersion so the initial state isn't replayed as a
+    burst of events. Runs until should_stop() or the cluster connection
+    goes away; transient failures reconnect with backoff.
+    """
+    source = _WATCH_SOURCES.get(resource_index)
+    if source is None:
+        return
+    from kubernetes import watch as k8s_watch
+
+    api_attr, method_name, namespaced = source
+    resource_version = ""
+    backoff = 1.0
+    while not should_stop():
+        api = getattr(kube, api_attr)
+        if api is None:
+            return
+        func = getattr(api, method_name)
+        ns_kwargs = {"namespace": kube.namespace} if namespaced else {}
+        try:
+            if not resource_version:
+                seed = kube._list_raw(func, limit=1, **ns_kwargs)
+                resource_version = (seed.get("metadata") or {}).get(
+                    "resourceVersion", ""
+                )
+            watch = k8s_watch.Watch()
+            for _event in watch.stream(
+                func,
+                resource_version=resource_version,
+                timeout_seconds=10,
+                **ns_kwargs,
+            ):
+                resource_version = watch.resource_version or resource_version
+                if should_stop():
+                    watch.stop()
+                    return
+                on_change()
+            backoff = 1.0
+        except Exception:
+            if should_stop():
+                return
+            # Covers 410 Gone (expired resourceVersion) and network blips.
+            resource_version = ""
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-import subprocess
-from typing import ClassVar
+import asyncio
+import functools
+from collections import deque
+from typing import Callable, ClassVar
 
+from textual import events
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal
+from textual.timer import Timer
 from textual.widgets import Static, Input, DataTable
 
 from kpilot.config import Config
+from kpilot.kube import watcher
 from kpilot.kube.client import KubeClient
 from kpilot.agent.loop import AgentLoop, AgentEvent
 from kpilot.ui.theme import APP_CSS
@@ -17,19 +22,6 @@ from kpilot.ui.resource_panel import ResourcePanel, ResourceTypeChanged
 from kpilot.ui.chat_panel import CopilotPanel, CopilotSubmitted
 from kpilot.ui.command_log import CommandLog
 
-# Maps resource panel index -> kube client method
-RESOURCE_FETCH = {
-    0: "list_pods",
-    1: "list_services",
-    2: "list_deployments",
-    3: "list_namespaces",
-    4: "list_nodes",
-    5: "list_configmaps",
-    6: "list_secrets",
-    7: "list_pvcs",
-    8: "list_events",
-}
-
 # k9s-style command aliases -> resource index
 COMMAND_ALIASES: dict[str, int] = {
     "pod": 0, "pods": 0, "po": 0,
@@ -49,7 +41,7 @@ class KPilotApp(App):
 
     CSS = APP_CSS
 
-    BINDINGS: ClassVar[list[Binding]] = [
+    BINDINGS: ClassVar[tuple[Binding, ...]] = (
         # k9s-style navigation
         Binding("colon", "command_mode", "Command", show=False),
         Binding("slash", "filter_mode", "Filter", show=False),
@@ -64,7 +56,7 @@ class KPilotApp(App):
         Binding("s", "shell", "Shell", show=False),
         # Quit
         Binding("ctrl+c", "quit", "Quit", show=False),
-    ]
+    )
 
     def __init__(self, config: Config) -> None:
         super().__init__()
@@ -74,6 +66,46 @@ class KPilotApp(App):
         self._agent_running = False
         self._current_tool_name = ""
         self._copilot_visible = False
+        self._refresh_pending: Timer | None = None
+        # While the terminal is unfocused, refreshes are skipped and the
+        # view marked dirty; the watch stream stays open so nothing is
+        # missed, and regaining focus catches up with a single LIST.
+        self._app_focused = True
+        self._dirty = False
+        self._filter_timer: Timer | None = None
+        self._help_text = self._build_help_text()
+        self._help_rendered = False
+        # Agent events are queued and drained on a short timer so a
+        # streamed response refreshes the copilot panel per burst, not
+        # per event.
+        self._event_queue: deque[AgentEvent] = deque()
+        self._drain_scheduled = False
+        # Event kind -> handler, mirroring the command verb table.
+        self._event_handlers: dict[str, Callable[[AgentEvent], None]] = {
+            "text": self._ev_text,
+            "thinking": self._ev_thinking,
+            "tool_use": self._ev_tool_use,
+            "tool_result": self._ev_tool_result,
+            "error": self._ev_error,
+            "done": self._ev_done,
+        }
+        # Command verb -> handler(arg); one dict lookup per command
+        # instead of walking an if/elif ladder. Unknown verbs fall back
+        # to kubectl.
+        self._verb_dispatch: dict[str, Callable[[str], None]] = {
+            alias: functools.partial(self._cmd_set_type, idx)
+            for alias, idx in COMMAND_ALIASES.items()
+        }
+        for verb in ("q", "quit"):
+            self._verb_dispatch[verb] = self._cmd_quit
+        for verb in ("ns", "namespace"):
+            self._verb_dispatch[verb] = self._cmd_ns
+        for verb in ("ctx", "context"):
+            self._verb_dispatch[verb] = self._cmd_ctx
+        for verb in ("xray", "pulses", "pu"):
+            self._verb_dispatch[verb] = functools.partial(
+                self._cmd_unsupported, verb
+            )
 
     def compose(self) -> ComposeResult:
         yield HeaderBar()
@@ -87,14 +119,38 @@ class KPilotApp(App):
         yield Static("", id="help-modal")
 
     def on_mount(self) -> None:
-        self.kube.connect()
+        # Resolve widgets once; query_one runs a CSS selector match over
+        # the widget tree and these are needed on every event afterwards.
+        self._panel = self.query_one(ResourcePanel)
+        self._copilot = self.query_one(CopilotPanel)
+        self._cmd_log = self.query_one(CommandLog)
+        self._header = self.query_one(HeaderBar)
+        self._crumb = self.query_one(CrumbBar)
+        self._filter_bar = self.query_one("#filter-bar", Input)
+        self._command_bar = self.query_one("#command-bar", Input)
+        self._help_modal = self.query_one("#help-modal", Static)
+        self._table = self.query_one("#resource-table", DataTable)
+
+        # Paint a placeholder frame immediately; kubeconfig loading and
+        # the TLS handshake happen in a worker and fill the UI in after.
+        header = self._header
+        header.cluster = "connecting..."
+        header.refresh_header()
+        self._crumb.set_view("Pods", self.kube.namespace)
+        self.run_worker(self._connect_async(), name="kube-connect")
+        self._focus_table()
 
-        # Update header with real cluster info
-        header = self.query_one(HeaderBar)
+    async def _connect_async(self) -> None:
+        await asyncio.to_thread(self.kube.connect)
+        self._on_connected()
+
+    def _on_connected(self) -> None:
+        """Apply cluster info once the background connect finishes."""
+        header = self._header
         header.cluster = self.kube.info.cluster_name
         header.context = self.kube.info.context_name
-        header.k8s_version = self._get_k8s_version()
         header.refresh_header()
+        self.run_worker(self._load_k8s_version(), name="k8s-version")
 
         # Configure agent
         self.agent.cluster_name = self.kube.info.cluster_name
@@ -102,11 +158,11 @@ class KPilotApp(App):
         self.agent.namespace = self.kube.namespace
 
         # Update breadcrumb
-        crumb = self.query_one(CrumbBar)
-        crumb.set_view("Pods", self.kube.namespace)
+        self._crumb.set_view(
+            self._panel.current_type_name, self.kube.namespace
+        )
 
-        # Log startup
-        cmd_log = self.query_one(CommandLog)
+        cmd_log = self._cmd_log
         if self.kube.connected:
             cmd_log.log_info(
                 f"Connected: {self.kube.info.context_name}"
@@ -115,22 +171,21 @@ class KPilotApp(App):
         else:
             cmd_log.log_error("kube", "Not connected to any cluster")
 
-        # Initial data + periodic refresh
+        # Initial data, then a watch stream keeps it current
         self._refresh_resources()
-        self.set_interval(5.0, self._refresh_resources)
-        self._focus_table()
+        self._start_watch()
 
     # ── Actions (k9s-style) ─────────────────────────────────────
 
     def action_command_mode(self) -> None:
-        cmd_bar = self.query_one("#command-bar", Input)
+        cmd_bar = self._command_bar
         cmd_bar.add_class("visible")
         cmd_bar.value = ":"
         cmd_bar.placeholder = ""
         cmd_bar.focus()
 
     def action_filter_mode(self) -> None:
-        filter_bar = self.query_one("#filter-bar", Input)
+        filter_bar = self._filter_bar
         filter_bar.add_class("visible")
         filter_bar.value = "/"
         filter_bar.placeholder = ""
@@ -139,38 +194,41 @@ class KPilotApp(App):
     def action_go_back(self) -> None:
         """Esc: close overlays, clear filter, or unfocus copilot."""
         # Close filter/command bars
-        self.query_one("#filter-bar", Input).remove_class("visible")
-        self.query_one("#command-bar", Input).remove_class("visible")
-        self.query_one("#help-modal", Static).remove_class("visible")
+        self._filter_bar.remove_class("visible")
+        self._command_bar.remove_class("visible")
+        self._help_modal.remove_class("visible")
 
         # Clear filter
-        panel = self.query_one(ResourcePanel)
+        panel = self._panel
         if panel._filter:
             panel.clear_filter()
-            self.query_one(CrumbBar).set_filter("")
-            self._refresh_resources()
+            self._crumb.set_filter("")
+            panel.apply_current_filter()
 
         self._focus_table()
 
     def action_toggle_copilot(self) -> None:
-        copilot = self.query_one(CopilotPanel)
+        copilot = self._copilot
         self._copilot_visible = not self._copilot_visible
         if self._copilot_visible:
             copilot.add_class("visible")
             copilot.focus_input()
-            self.query_one(CrumbBar).set_copilot_active(True)
+            self._crumb.set_copilot_active(True)
         else:
             copilot.remove_class("visible")
-            self.query_one(CrumbBar).set_copilot_active(False)
+            self._crumb.set_copilot_active(False)
             self._focus_table()
 
     def action_toggle_help(self) -> None:
-        modal = self.query_one("#help-modal", Static)
+        modal = self._help_modal
         if modal.has_class("visible"):
             modal.remove_class("visible")
             self._focus_table()
         else:
-            modal.update(self._build_help_text())
+            # The text is static, so render it into the modal only once.
+            if not self._help_rendered:
+                modal.update(self._help_text)
+                self._help_rendered = True
             modal.add_class("visible")
             modal.focus()
 
@@ -190,153 +248,257 @@ class KPilotApp(App):
         """s: exec into selected pod via copilot."""
         self._ask_copilot_about_selected("shell")
 
-    def action_quit(self) -> None:
+    async def action_quit(self) -> None:
         self.agent.cancel()
+        await self.agent.close()
         self.exit()
 
     # ── Event handlers ──────────────────────────────────────────
 
     def on_resource_type_changed(self, event: ResourceTypeChanged) -> None:
-        crumb = self.query_one(CrumbBar)
+        crumb = self._crumb
         crumb.set_view(event.name, self.kube.namespace)
         self._refresh_resources()
+        self._start_watch()
 
     def on_copilot_submitted(self, event: CopilotSubmitted) -> None:
         if self._agent_running:
             return
         self._run_agent(event.text)
 
-    def on_input_submitted(self, event: Input.Submitted) -> None:
+    async def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id == "command-bar":
             event.input.remove_class("visible")
             cmd = event.value.strip().lstrip(":")
-            self._handle_command(cmd)
+            await self._handle_command(cmd)
             self._focus_table()
         elif event.input.id == "filter-bar":
             event.input.remove_class("visible")
-            filt = event.value.strip().lstrip("/")
-            panel = self.query_one(ResourcePanel)
-            panel.set_filter(filt)
-            self.query_one(CrumbBar).set_filter(filt)
-            self._refresh_resources()
+            if self._filter_timer is not None:
+                self._filter_timer.stop()
+                self._filter_timer = None
+            self._apply_filter(event.value.strip().lstrip("/"))
             self._focus_table()
 
+    def on_input_changed(self, event: Input.Changed) -> None:
+        # Live filtering: each keystroke resets a short timer so the
+        # table re-filters once the user pauses, from cached rows.
+        if event.input.id != "filter-bar" or not event.input.has_class(
+            "visible"
+        ):
+            return
+        filt = event.value.strip().lstrip("/")
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(
+            0.25, functools.partial(self._apply_filter, filt)
+        )
+
+    def _apply_filter(self, filt: str) -> None:
+        self._filter_timer = None
+        self._panel.set_filter(filt)
+        self._crumb.set_filter(filt)
+        self._panel.apply_current_filter()
+
+    def on_app_blur(self, event: events.AppBlur) -> None:
+        self._app_focused = False
+
+    def on_app_focus(self, event: events.AppFocus) -> None:
+        self._app_focused = True
+        if self._dirty:
+            self._dirty = False
+            self._refresh_resources()
+
     # ── Internal ────────────────────────────────────────────────
 
     def _focus_table(self) -> None:
         try:
-            self.query_one("#resource-table", DataTable).focus()
+            self._table.focus()
         except Exception:
             pass
 
-    def _get_k8s_version(self) -> str:
-        if not self.kube.connected:
-            return ""
-        try:
-            v = self.kube._core.api_client.call_api(
-                "/version", "GET", response_type="object"
-            )
-            return v[0].get("gitVersion", "") if isinstance(v[0], dict) else ""
-        except Exception:
-            return ""
+    async def _load_k8s_version(self) -> None:
+        version = await asyncio.to_thread(self.kube.get_k8s_version)
+        if version:
+            self._header.k8s_version = version
+            self._header.refresh_header()
 
     def _refresh_resources(self) -> None:
-        panel = self.query_one(ResourcePanel)
-        rt = panel.current_type
-        method_name = RESOURCE_FETCH.get(rt)
-        if not method_name or not self.kube.connected:
+        if not self._app_focused:
+            self._dirty = True
+            return
+        method = self.kube.fetch_method(self._panel.current_type)
+        if method is None or not self.kube.connected:
+            return
+        # LIST calls block on apiserver RTT, so run them off the event loop;
+        # exclusive workers coalesce refreshes that arrive mid-fetch. The
+        # dedicated group matters: exclusive cancels everything in its
+        # group, and the agent/connect workers must not be collateral.
+        self.run_worker(
+            self._fetch_resources(method),
+            name="kube-refresh",
+            group="kube-refresh",
+            exclusive=True,
+        )
+
+    def _schedule_refresh(self) -> None:
+        """Coalesce bursts of refresh triggers into one LIST.
+
+        An agent turn can emit many tool results back-to-back and a busy
+        cluster many watch events; each used to cause its own full LIST.
+        250ms is below perception but wide enough to merge a burst.
+        """
+        if self._refresh_pending is not None:
+            self._refresh_pending.stop()
+        self._refresh_pending = self.set_timer(0.25, self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        self._refresh_pending = None
+        self._refresh_resources()
+
+    def _start_watch(self) -> None:
+        """(Re)start the watch stream for the current resource type.
+
+        Watch events replace the old 5s re-list poll: the apiserver
+        pushes changes and each one triggers the normal list+diff
+        refresh. Runs in a thread worker since the kubernetes watch
+        client is blocking; exclusive so switching resource type,
+        namespace or context supersedes the previous stream.
+        """
+        if not self.kube.connected:
             return
+        self.run_worker(
+            self._watch_worker,
+            name="kube-watch",
+            group="kube-watch",
+            exclusive=True,
+            thread=True,
+        )
+
+    def _watch_worker(self) -> None:
+        from textual.worker import get_current_worker
+
+        worker = get_current_worker()
+        watcher.watch_changes(
+            self.kube,
+            self._panel.current_type,
+            on_change=lambda: self.call_from_thread(self._schedule_refresh),
+            should_stop=lambda: worker.is_cancelled,
+        )
+
+    async def _fetch_resources(self, method: Callable) -> None:
+        panel = self._panel
         try:
-            method = getattr(self.kube, method_name)
-            headers, rows = method()
+            headers, rows = await asyncio.to_thread(method)
             panel.update_data(headers, rows)
         except Exception as e:
-            panel.update_data(["ERROR"], [[str(e)]])
+            panel.update_data(["ERROR"], [(str(e),)])
 
-    def _handle_command(self, cmd: str) -> None:
+    async def _handle_command(self, cmd: str) -> None:
         """Process k9s-style : commands."""
         if not cmd:
             return
-        cmd_log = self.query_one(CommandLog)
-        panel = self.query_one(ResourcePanel)
-
+        # cmd arrives pre-stripped from on_input_submitted and
+        # split(None, 1) eats the separating whitespace, so verb and arg
+        # need no further trimming. Only the verb is case-normalized;
+        # args (namespace, context, kubectl flags) keep their case.
         parts = cmd.split(None, 1)
-        verb = parts[0].lower()
-        arg = parts[1].strip() if len(parts) > 1 else ""
+        verb = parts[0].casefold()
+        arg = parts[1] if len(parts) > 1 else ""
 
-        # :q / :quit
-        if verb in ("q", "quit"):
-            self.action_quit()
+        handler = self._verb_dispatch.get(verb)
+        if handler is not None:
+            handler(arg)
             return
+        await self._kubectl_fallback(cmd)
 
-        # :ns <name> — switch namespace
-        if verb in ("ns", "namespace") and arg:
-            self.kube.set_namespace(arg)
-            self.agent.namespace = arg
-            self.query_one(CrumbBar).set_view(
-                panel.current_type_name, arg
-            )
-            cmd_log.log_info(f"Namespace: {arg}")
-            self._refresh_resources()
-            return
+    # ── Command verbs ───────────────────────────────────────────
 
-        # :ctx / :context — list or switch context
-        if verb in ("ctx", "context"):
-            if arg:
-                ok = self.kube.switch_context(arg)
-                if ok:
-                    self.agent.cluster_name = self.kube.info.cluster_name
-                    self.agent.context_name = self.kube.info.context_name
-                    self.agent.namespace = self.kube.namespace
-                    header = self.query_one(HeaderBar)
-                    header.cluster = self.kube.info.cluster_name
-                    header.context = self.kube.info.context_name
-                    header.refresh_header()
-                    self.query_one(CrumbBar).set_view(
-                        panel.current_type_name, self.kube.namespace
-                    )
-                    cmd_log.log_ok("ctx", f"Switched to {arg}")
-                    self._refresh_resources()
-                else:
-                    cmd_log.log_error("ctx", f"Failed to switch to {arg}")
-            else:
-                contexts = self.kube.list_contexts()
-                if contexts:
-                    for name, active in contexts:
-                        marker = " *" if active else ""
-                        cmd_log.log_info(f"  {name}{marker}")
-                else:
-                    cmd_log.log_error("ctx", "No contexts found")
-            return
+    def _cmd_quit(self, arg: str) -> None:
+        self.run_worker(self.action_quit())
 
-        # Resource navigation aliases
-        if verb in COMMAND_ALIASES:
-            idx = COMMAND_ALIASES[verb]
-            panel.set_resource_type(idx)
-            return
+    def _cmd_set_type(self, idx: int, arg: str) -> None:
+        self._panel.set_resource_type(idx)
 
-        # :xray, :pulses — not implemented
-        if verb in ("xray", "pulses", "pu"):
-            cmd_log.log_info(f":{verb} not yet supported")
+    def _cmd_ns(self, arg: str) -> None:
+        """:ns <name> switches namespace; bare :ns shows the list."""
+        if not arg:
+            self._panel.set_resource_type(3)
             return
+        self.kube.set_namespace(arg)
+        self.agent.namespace = arg
+        self._crumb.set_view(self._panel.current_type_name, arg)
+        self._cmd_log.log_info(f"Namespace: {arg}")
+        self._refresh_resources()
+        self._start_watch()
+
+    def _cmd_ctx(self, arg: str) -> None:
+        """:ctx <name> switches context; bare :ctx lists them."""
+        cmd_log = self._cmd_log
+        if arg:
+            ok = self.kube.switch_context(arg)
+            if ok:
+                self.agent.cluster_name = self.kube.info.cluster_name
+                self.agent.context_name = self.kube.info.context_name
+                self.agent.namespace = self.kube.namespace
+                header = self._header
+                header.cluster = self.kube.info.cluster_name
+                header.context = self.kube.info.context_name
+                header.refresh_header()
+                self.run_worker(self._load_k8s_version(), name="k8s-version")
+                self._crumb.set_view(
+                    self._panel.current_type_name, self.kube.namespace
+                )
+                cmd_log.log_ok("ctx", f"Switched to {arg}")
+                self._refresh_resources()
+                self._start_watch()
+            else:
+                cmd_log.log_error("ctx", f"Failed to switch to {arg}")
+        else:
+            contexts = self.kube.list_contexts()
+            if contexts:
+                for name, active in contexts:
+                    marker = " *" if active else ""
+                    cmd_log.log_info(f"  {name}{marker}")
+            else:
+                cmd_log.log_error("ctx", "No contexts found")
+
+    def _cmd_unsupported(self, verb: str, arg: str) -> None:
+        self._cmd_log.log_info(f":{verb} not yet supported")
 
-        # Fallback: try as kubectl
+    async def _kubectl_fallback(self, cmd: str) -> None:
+        # Async subprocess: output streams into the log line by line as
+        # it arrives instead of appearing all at once (truncated) after
+        # the command exits, and no worker thread sits blocked on it.
+        cmd_log = self._cmd_log
         cmd_log.log_tool("kubectl", cmd)
         try:
-            result = subprocess.run(
-                ["kubectl"] + cmd.split(),
-                capture_output=True,
-                text=True,
-                timeout=30,
+            proc = await asyncio.create_subprocess_exec(
+                "kubectl",
+                *cmd.split(),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
             )
-            output = result.stdout or result.stderr
-            cmd_log.log_ok("kubectl", output.strip()[:200])
         except Exception as e:
             cmd_log.log_error("kubectl", str(e))
+            return
+        try:
+            await asyncio.wait_for(self._stream_kubectl_output(proc), 30)
+        except asyncio.TimeoutError:
+            proc.kill()
+            cmd_log.log_error("kubectl", "timed out after 30s")
+
+    async def _stream_kubectl_output(self, proc) -> None:
+        cmd_log = self._cmd_log
+        async for line in proc.stdout:
+            text = line.decode(errors="replace").rstrip()
+            if text:
+                cmd_log.log_ok("kubectl", text[:200])
+        await proc.wait()
 
     def _ask_copilot_about_selected(self, action: str) -> None:
         """Use copilot to perform an action on the selected resource."""
-        panel = self.query_one(ResourcePanel)
+        panel = self._panel
         name = panel.get_selected_name()
         if not name:
             return
@@ -344,13 +506,19 @@ class KPilotApp(App):
         resource_type = panel.current_type_name.lower().rstrip("s")
         ns = self.kube.namespace
 
-        prompts = {
-            "describe": f"kubectl describe {resource_type} {name} -n {ns}",
-            "yaml": f"kubectl get {resource_type} {name} -n {ns} -o yaml",
-            "logs": f"kubectl logs {name} -n {ns} --tail=100",
-            "shell": f"Explain how to exec into pod {name} in namespace {ns}. Do NOT actually exec.",
-        }
-        prompt = prompts.get(action, f"kubectl describe {resource_type} {name} -n {ns}")
+        # Format only the prompt actually used; "describe" doubles as
+        # the fallback for unknown actions.
+        if action == "yaml":
+            prompt = f"kubectl get {resource_type} {name} -n {ns} -o yaml"
+        elif action == "logs":
+            prompt = f"kubectl logs {name} -n {ns} --tail=100"
+        elif action == "shell":
+            prompt = (
+                f"Explain how to exec into pod {name} in namespace {ns}."
+                " Do NOT actually exec."
+            )
+        else:
+            prompt = f"kubectl describe {resource_type} {name} -n {ns}"
 
         # Show copilot if hidden
         if not self._copilot_visible:
@@ -360,8 +528,8 @@ class KPilotApp(App):
             self._run_agent(prompt)
 
     def _run_agent(self, prompt: str) -> None:
-        copilot = self.query_one(CopilotPanel)
-        cmd_log = self.query_one(CommandLog)
+        copilot = self._copilot
+        cmd_log = self._cmd_log
 
         copilot.add_user_message(prompt)
         copilot.add_status("thinking...")
@@ -373,44 +541,75 @@ class KPilotApp(App):
         self.run_worker(
             self._agent_worker(prompt),
             name="copilot_agent",
+            group="copilot_agent",
             exclusive=True,
         )
 
     async def _agent_worker(self, prompt: str) -> None:
         try:
-            await self.agent.run(prompt, on_event=self._on_agent_event)
+            async for event in self.agent.stream(prompt):
+                self._on_agent_event(event)
         finally:
+            # Flush anything still queued so the separator lands last.
+            self._drain_events()
             self._agent_running = False
-            self.query_one(CopilotPanel).add_separator()
+            self._copilot.add_separator()
 
     def _on_agent_event(self, event: AgentEvent) -> None:
-        copilot = self.query_one(CopilotPanel)
-        cmd_log = self.query_one(CommandLog)
-
-        if event.kind == "text":
-            copilot.add_assistant_text(event.text)
-        elif event.kind == "thinking":
-            copilot.add_status(f"thinking: {event.text[:80]}...")
-        elif event.kind == "tool_use":
-            self._current_tool_name = event.tool_name
-            copilot.add_tool_call(event.tool_name, event.tool_input)
-            cmd_log.log_tool(event.tool_name, event.tool_input[:100])
-        elif event.kind == "tool_result":
-            name = self._current_tool_name or "tool"
-            if event.is_error:
-                copilot.add_tool_result(event.text, True)
-                cmd_log.log_error(name, event.text[:100])
-            else:
-                copilot.add_tool_result(event.text, False)
-                cmd_log.log_ok(name, event.text[:100])
-            self._refresh_resources()
-        elif event.kind == "error":
-            copilot.add_error(event.text)
-            cmd_log.log_error("copilot", event.text)
-        elif event.kind == "done":
-            self._agent_running = False
+        self._event_queue.append(event)
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.set_timer(0.03, self._drain_events)
+
+    def _drain_events(self) -> None:
+        self._drain_scheduled = False
+        queue = self._event_queue
+        while queue:
+            event = queue.popleft()
+            if event.kind == "text":
+                # Merge a run of text events into one panel write.
+                parts = [event.text]
+                while queue and queue[0].kind == "text":
+                    parts.append(queue.popleft().text)
+                if len(parts) > 1:
+                    event = AgentEvent(kind="text", text="\n".join(parts))
+            self._dispatch_agent_event(event)
+
+    def _dispatch_agent_event(self, event: AgentEvent) -> None:
+        handler = self._event_handlers.get(event.kind)
+        if handler:
+            handler(event)
+
+    def _ev_text(self, event: AgentEvent) -> None:
+        self._copilot.add_assistant_text(event.text)
+
+    def _ev_thinking(self, event: AgentEvent) -> None:
+        self._copilot.add_status(f"thinking: {event.text[:80]}...")
+
+    def _ev_tool_use(self, event: AgentEvent) -> None:
+        self._current_tool_name = event.tool_name
+        self._copilot.add_tool_call(event.tool_name, event.tool_input)
+        self._cmd_log.log_tool(event.tool_name, event.tool_input[:100])
+
+    def _ev_tool_result(self, event: AgentEvent) -> None:
+        name = self._current_tool_name or "tool"
+        if event.is_error:
+            self._copilot.add_tool_result(event.text, True)
+            self._cmd_log.log_error(name, event.text[:100])
+        else:
+            self._copilot.add_tool_result(event.text, False)
+            self._cmd_log.log_ok(name, event.text[:100])
+        self._schedule_refresh()
+
+    def _ev_error(self, event: AgentEvent) -> None:
+        self._copilot.add_error(event.text)
+        self._cmd_log.log_error("copilot", event.text)
+
+    def _ev_done(self, event: AgentEvent) -> None:
+        self._agent_running = False
 
-    def _build_help_text(self) -> str:
+    @staticmethod
+    def _build_help_text() -> str:
         return (
             "[bold #00d7af]kpilot — Keyboard Shortcuts[/]\n"
             "\n"
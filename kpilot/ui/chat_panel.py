@@ -1,10 +1,25 @@
 from __future__ import annotations
 
+from collections import deque
+
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.widgets import RichLog, Input
 from textual.message import Message as TextualMessage
 
+# Flush early if a burst queues this many entries between timer ticks.
+_FLUSH_THRESHOLD = 64
+
+# Static prefixes parsed once; entries are Text objects assembled from
+# these, so RichLog never runs the markup tokenizer on the hot path.
+_USER_PREFIX = Text.from_markup("[bold #d7af00]>[/] ")
+_ERROR_PREFIX = Text.from_markup("[bold red]error:[/] ")
+_TOOL_ERR_PREFIX = Text.from_markup("  [bold red]err:[/] ")
+_SEPARATOR = Text("─" * 40, style="dim")
+_TOOL_STYLE = "bold #ff8700"
+_TOOL_PREFIX = Text("  $ ", style=_TOOL_STYLE)
+
 
 class CopilotSubmitted(TextualMessage):
     """Posted when user submits a copilot prompt."""
@@ -20,61 +35,97 @@ class CopilotPanel(Vertical):
     def __init__(self) -> None:
         super().__init__(id="copilot-panel")
         self.border_title = "Copilot"
+        # Same buffering as CommandLog: entries queue here and flush as
+        # one write per interval tick, so streamed agent bursts don't
+        # rerender the log per entry.
+        self._pending: deque[Text] = deque()
 
     def compose(self) -> ComposeResult:
-        yield RichLog(id="copilot-log", markup=True, wrap=True)
+        # Bounded history: RichLog's ring buffer drops old lines in
+        # O(1), keeping write cost flat over long sessions.
+        yield RichLog(id="copilot-log", markup=True, wrap=True, max_lines=2000)
         yield Input(placeholder="Ask about your cluster...", id="copilot-input")
 
+    def on_mount(self) -> None:
+        self._log = self.query_one("#copilot-log", RichLog)
+        self._input = self.query_one("#copilot-input", Input)
+        self.set_interval(0.08, self._flush)
+
+    def _write(self, entry: Text) -> None:
+        self._pending.append(entry)
+        if len(self._pending) >= _FLUSH_THRESHOLD:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._pending:
+            if len(self._pending) == 1:
+                self._log.write(self._pending[0])
+            else:
+                self._log.write(Text("\n").join(self._pending))
+            self._pending.clear()
+
     def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id == "copilot-input" and event.value.strip():
             text = event.value.strip()
             event.input.value = ""
             self.post_message(CopilotSubmitted(text))
 
+    # Helpers assemble one Text per entry and write once: each
+    # RichLog.write goes through the layout/refresh pipeline, and a
+    # Text skips the markup parse a raw string would pay.
+
     def add_user_message(self, text: str) -> None:
-        log = self.query_one("#copilot-log", RichLog)
-        log.write(f"[bold #d7af00]>[/] {text}")
-        log.write("")
+        self._write(Text.assemble(_USER_PREFIX, text, "\n"))
 
     def add_assistant_text(self, text: str) -> None:
-        log = self.query_one("#copilot-log", RichLog)
-        log.write(f"[#00d7af]{text}[/]")
+        self._write(Text(text, style="#00d7af"))
 
     def add_tool_call(self, tool_name: str, tool_input: str) -> None:
-        log = self.query_one("#copilot-log", RichLog)
-        log.write(f"  [bold #ff8700]$ {tool_name}[/]")
+        # str.split always yields at least one element, so lines[0] is
+        # safe; an ellipsis marks either a cut first line or more lines.
         lines = tool_input.strip().split("\n")
-        preview = lines[0][:120] if lines else ""
-        if len(lines) > 1 or (lines and len(preview) < len(lines[0])):
+        first = lines[0]
+        preview = first[:120]
+        if preview and (len(lines) > 1 or len(preview) < len(first)):
             preview += "..."
         if preview:
-            log.write(f"    [dim]{preview}[/]")
+            entry = Text.assemble(
+                _TOOL_PREFIX,
+                (tool_name, _TOOL_STYLE),
+                ("\n    " + preview, "dim"),
+            )
+        else:
+            entry = Text.assemble(_TOOL_PREFIX, (tool_name, _TOOL_STYLE))
+        self._write(entry)
 
     def add_tool_result(self, text: str, is_error: bool = False) -> None:
-        log = self.query_one("#copilot-log", RichLog)
         if is_error:
-            log.write(f"  [bold red]err:[/] [red]{_truncate(text, 200)}[/]")
+            self._write(
+                Text.assemble(_TOOL_ERR_PREFIX, (_truncate(text, 200), "red"))
+            )
         else:
-            truncated = _truncate(text, 300)
-            log.write(f"  [dim]{truncated}[/]")
+            self._write(Text("  " + _truncate(text, 300), style="dim"))
 
     def add_error(self, text: str) -> None:
-        log = self.query_one("#copilot-log", RichLog)
-        log.write(f"[bold red]error:[/] [red]{text}[/]")
+        self._write(Text.assemble(_ERROR_PREFIX, (text, "red")))
 
     def add_separator(self) -> None:
-        log = self.query_one("#copilot-log", RichLog)
-        log.write("[dim]" + "─" * 40 + "[/]")
+        self._write(_SEPARATOR)
 
     def add_status(self, text: str) -> None:
-        log = self.query_one("#copilot-log", RichLog)
-        log.write(f"[dim italic]{text}[/]")
+        self._write(Text(text, style="dim italic"))
 
     def focus_input(self) -> None:
-        self.query_one("#copilot-input", Input).focus()
+        self._input.focus()
 
 
 def _truncate(text: str, max_len: int) -> str:
+    """Collapse text to a single line of at most max_len chars."""
+    # Most tool results are short single-line snippets; str.strip
+    # returns the original object when there is nothing to strip, so
+    # this path usually allocates nothing.
+    if len(text) <= max_len and "\n" not in text:
+        return text.strip()
     text = text.replace("\n", " ").strip()
     if len(text) > max_len:
         return text[:max_len] + "..."
@@ -1,31 +1,73 @@
 from __future__ import annotations
 
-from datetime import datetime
+import time
+from collections import deque
 
 from textual.widgets import RichLog
 
+# Default ring size; RichLog drops lines beyond this for free.
+_MAX_LINES = 500
+
+# Flush early if a burst queues this many entries between timer ticks.
+_FLUSH_THRESHOLD = 64
+
+# (epoch second, formatted HH:MM:SS); bursts of log calls land in the
+# same second, so the strftime is paid once per second at most.
+_ts_cache: tuple[int, str] = (-1, "")
+
+
+def _ts() -> str:
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _ts_cache[1]
+
 
 class CommandLog(RichLog):
     """Bottom panel: timestamped command/action log."""
 
     def __init__(self) -> None:
-        super().__init__(id="command-log", markup=True, wrap=True, max_lines=200)
+        super().__init__(
+            id="command-log", markup=True, wrap=True, max_lines=_MAX_LINES
+        )
         self.border_title = "Command Log"
+        # Entries buffer here and flush on a short interval, so a burst
+        # (kubectl stream lines, agent tool events) costs one widget
+        # write instead of one per entry.
+        self._pending: deque[str] = deque()
+
+    def on_mount(self) -> None:
+        self.set_interval(0.08, self._flush)
+
+    def set_maxlen(self, n: int) -> None:
+        """Cap how many log lines are retained."""
+        self.max_lines = n
+
+    def _push(self, entry: str) -> None:
+        self._pending.append(entry)
+        if len(self._pending) >= _FLUSH_THRESHOLD:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._pending:
+            self.write("\n".join(self._pending))
+            self._pending.clear()
 
     def log_tool(self, name: str, detail: str) -> None:
-        ts = datetime.now().strftime("%H:%M:%S")
-        self.write(
+        ts = _ts()
+        self._push(
             f"[dim]{ts}[/] [rgb(255,165,0)]\\[TOOL][/] {name} {detail}"
         )
 
     def log_ok(self, name: str, detail: str) -> None:
-        ts = datetime.now().strftime("%H:%M:%S")
-        self.write(f"[dim]{ts}[/] [green]\\[OK  ][/] {name} -> {detail}")
+        ts = _ts()
+        self._push(f"[dim]{ts}[/] [green]\\[OK  ][/] {name} -> {detail}")
 
     def log_error(self, name: str, detail: str) -> None:
-        ts = datetime.now().strftime("%H:%M:%S")
-        self.write(f"[dim]{ts}[/] [red]\\[ERR ][/] {name} -> {detail}")
+        ts = _ts()
+        self._push(f"[dim]{ts}[/] [red]\\[ERR ][/] {name} -> {detail}")
 
     def log_info(self, msg: str) -> None:
-        ts = datetime.now().strftime("%H:%M:%S")
-        self.write(f"[dim]{ts}[/] [white]\\[INFO][/] {msg}")
+        ts = _ts()
+        self._push(f"[dim]{ts}[/] [white]\\[INFO][/] {msg}")
@@ -19,7 +19,11 @@ class HeaderBar(Static):
         self.k8s_version = k8s_version
         super().__init__("", id="header-bar")
 
-    def render(self) -> str:
+    # The bar content only changes on explicit state updates, so it is
+    # rebuilt into the Static then instead of re-formatted on every
+    # repaint a parent refresh triggers.
+
+    def _rebuild(self) -> None:
         parts = [" [bold #00d7af]kpilot[/]"]
         if self.context:
             parts.append(f"ctx: [#d7af00]{self.context}[/]")
@@ -27,10 +31,13 @@ class HeaderBar(Static):
             parts.append(f"cluster: [#d7af00]{self.cluster}[/]")
         if self.k8s_version:
             parts.append(f"k8s: [#d7af00]{self.k8s_version}[/]")
-        return "  ".join(parts)
+        self.update("  ".join(parts))
+
+    def on_mount(self) -> None:
+        self._rebuild()
 
     def refresh_header(self) -> None:
-        self.refresh()
+        self._rebuild()
 
 
 class CrumbBar(Static):
@@ -43,7 +50,7 @@ class CrumbBar(Static):
         self._copilot_active = False
         super().__init__("", id="crumb-bar")
 
-    def render(self) -> str:
+    def _rebuild(self) -> None:
         crumb = f" [bold #00d7af]{self._resource}[/][dim]({self._namespace})[/]"
         hints = []
         if self._filter:
@@ -57,17 +64,29 @@ class CrumbBar(Static):
             "[dim]<esc>[/]:back",
         ])
         right = "  ".join(hints)
-        return crumb + "  " + right
+        self.update(crumb + "  " + right)
+
+    def on_mount(self) -> None:
+        self._rebuild()
+
+    # Setters rebuild only on an actual change; callers re-push current
+    # state freely (e.g. on every refresh cycle).
 
     def set_view(self, resource: str, namespace: str) -> None:
+        if resource == self._resource and namespace == self._namespace:
+            return
         self._resource = resource
         self._namespace = namespace
-        self.refresh()
+        self._rebuild()
 
     def set_filter(self, f: str) -> None:
+        if f == self._filter:
+            return
         self._filter = f
-        self.refresh()
+        self._rebuild()
 
     def set_copilot_active(self, active: bool) -> None:
+        if active == self._copilot_active:
+            return
         self._copilot_active = active
-        self.refresh()
+        self._rebuild()
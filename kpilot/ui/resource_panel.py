@@ -3,20 +3,21 @@ from __future__ import annotations
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.widgets import DataTable
+from textual.widgets.data_table import CellDoesNotExist, RowDoesNotExist
 from textual.message import Message as TextualMessage
 
-# k9s-style resource aliases
-RESOURCE_TYPES = {
-    0: "Pods",
-    1: "Services",
-    2: "Deployments",
-    3: "Namespaces",
-    4: "Nodes",
-    5: "ConfigMaps",
-    6: "Secrets",
-    7: "PersistentVolumeClaims",
-    8: "Events",
-}
+# k9s-style resource kinds, indexed by resource type (0..8)
+RESOURCE_TYPES = (
+    "Pods",
+    "Services",
+    "Deployments",
+    "Namespaces",
+    "Nodes",
+    "ConfigMaps",
+    "Secrets",
+    "PersistentVolumeClaims",
+    "Events",
+)
 
 
 class ResourceTypeChanged(TextualMessage):
@@ -35,16 +36,26 @@ class ResourcePanel(Vertical):
         super().__init__(id="resource-panel")
         self._current_type = 0
         self._filter = ""
+        # Previous refresh, keyed by name, for diffing instead of rebuilding
+        self._last_headers: list[str] | None = None
+        self._last_rows: dict[str, tuple[str, ...]] = {}
+        # Unfiltered copy of the latest fetch, so filter changes re-render
+        # locally instead of re-listing from the apiserver. Each row's
+        # lowercased text is precomputed alongside: one substring test
+        # per row when filtering instead of lowercasing every cell.
+        self._all_headers: list[str] | None = None
+        self._all_rows: list[tuple[str, ...]] = []
+        self._rows_lower: list[str] = []
 
     def compose(self) -> ComposeResult:
         yield DataTable(id="resource-table")
 
     def on_mount(self) -> None:
-        table = self.query_one("#resource-table", DataTable)
-        table.cursor_type = "row"
+        self._table = self.query_one("#resource-table", DataTable)
+        self._table.cursor_type = "row"
 
     def set_resource_type(self, index: int) -> None:
-        if index in RESOURCE_TYPES:
+        if 0 <= index < len(RESOURCE_TYPES):
             self._current_type = index
             self.post_message(
                 ResourceTypeChanged(index, RESOURCE_TYPES[index])
@@ -56,7 +67,9 @@ class ResourcePanel(Vertical):
 
     @property
     def current_type_name(self) -> str:
-        return RESOURCE_TYPES.get(self._current_type, "Unknown")
+        if 0 <= self._current_type < len(RESOURCE_TYPES):
+            return RESOURCE_TYPES[self._current_type]
+        return "Unknown"
 
     def set_filter(self, f: str) -> None:
         self._filter = f.lower()
@@ -65,26 +78,114 @@ class ResourcePanel(Vertical):
         self._filter = ""
 
     def update_data(
-        self, headers: list[str], rows: list[list[str]]
+        self, headers: list[str], rows: list[tuple[str, ...]]
     ) -> None:
-        table = self.query_one("#resource-table", DataTable)
-        table.clear(columns=True)
-        for h in headers:
-            table.add_column(h, key=h)
-        for row in rows:
-            if self._filter:
-                if not any(self._filter in cell.lower() for cell in row):
-                    continue
-            table.add_row(*row)
+        """Refresh the table, mutating only rows that actually changed.
+
+        Rows are keyed by the first column; between refreshes most of
+        them are identical, so the common case issues near-zero
+        DataTable operations. Falls back to a full rebuild when the
+        schema changes or keys are not unique (e.g. Events).
+
+        Rows outside the scrollport are never painted — DataTable only
+        renders visible lines and caches those renderables — so rows
+        are stored for the whole result set rather than a managed
+        visible window, keeping cursor movement and scrolling on the
+        real data.
+        """
+        table = self._table
+        self._all_headers = list(headers)
+        if rows is not self._all_rows:
+            # New data; re-filters reuse the cached lowercase text.
+            self._all_rows = rows
+            self._rows_lower = ["\n".join(row).lower() for row in rows]
+        if self._filter:
+            f = self._filter
+            rows = [
+                row
+                for row, text in zip(rows, self._rows_lower)
+                if f in text
+            ]
+
+        new_by_key = {row[0]: row for row in rows}
+        if (
+            headers != self._last_headers
+            or len(new_by_key) != len(rows)
+            or not self._last_rows
+        ):
+            self._rebuild(table, headers, rows, new_by_key)
+            return
+
+        last = self._last_rows
+        for key in last.keys() - new_by_key.keys():
+            table.remove_row(key)
+        for key, row in new_by_key.items():
+            old = last.get(key)
+            if old is None:
+                table.add_row(*row, key=key)
+            elif old != row:
+                # Usually one volatile column moved (AGE, RESTARTS);
+                # leave the identical cells alone.
+                for header, old_value, value in zip(headers, old, row):
+                    if old_value != value:
+                        # update_width: a new value wider than the
+                        # column (Running -> CrashLoopBackOff) must
+                        # widen it, not render cropped.
+                        table.update_cell(
+                            key, header, value, update_width=True
+                        )
+        self._last_rows = new_by_key
+
+    def _rebuild(
+        self,
+        table: DataTable,
+        headers: list[str],
+        rows: list[tuple[str, ...]],
+        new_by_key: dict[str, tuple[str, ...]],
+    ) -> None:
+        if headers == self._last_headers:
+            # Same schema (e.g. the unkeyed Events fallback): dropping
+            # rows only preserves column layout and measured widths.
+            table.clear()
+        else:
+            table.clear(columns=True)
+            for h in headers:
+                table.add_column(h, key=h)
+        keyed = len(new_by_key) == len(rows)
+        if keyed:
+            # Per-row keys (needed for diffing) force individual adds.
+            for row in rows:
+                table.add_row(*row, key=row[0])
+        else:
+            table.add_rows(rows)
+        self._last_headers = list(headers)
+        # Empty when unkeyed, which forces a rebuild next refresh too.
+        self._last_rows = new_by_key if keyed else {}
+
+    def apply_current_filter(self) -> None:
+        """Re-render the cached rows under the current filter.
+
+        No apiserver round-trip: the diff in update_data adds back rows
+        the old filter hid and drops ones the new filter excludes.
+        """
+        if self._all_headers is not None:
+            self.update_data(self._all_headers, self._all_rows)
 
     def get_selected_row(self) -> list[str] | None:
         """Return the currently highlighted row data."""
-        table = self.query_one("#resource-table", DataTable)
+        table = self._table
+        coord = table.cursor_coordinate
+        # Cheap guard: keypresses on an empty or just-cleared table are
+        # common and shouldn't pay for exception construction.
+        if table.row_count == 0 or coord.row < 0:
+            return None
         try:
-            row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
-            row = table.get_row(row_key)
-            return [str(cell) for cell in row]
-        except Exception:
+            row_key, _ = table.coordinate_to_cell_key(coord)
+            # Cells went in as str via update_data; copy so callers
+            # can't mutate the table's internal row list.
+            return list(table.get_row(row_key))
+        except (CellDoesNotExist, RowDoesNotExist):
+            # Cursor can briefly point at a row the diff just removed.
             return None
 
     def get_selected_name(self) -> str | None: